@@ -8,7 +8,7 @@ from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
-from app.core.database import Base
+from app.core.database import Base, get_connect_args
 from config import settings
 
 config = context.config
@@ -19,54 +19,9 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
-def get_url():
-    """
-    Construct database URL for migrations.
-    Supports PostgreSQL and MySQL similar to Laravel's database configuration.
-    """
-    connection = settings.DB_CONNECTION.lower()
-
-    # PostgreSQL connection strings
-    if connection in ["postgresql", "postgres"]:
-        return f"postgresql://{settings.DB_USERNAME}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}"
-
-    # MySQL connection strings
-    elif connection in ["mysql", "mysql+pymysql"]:
-        return f"mysql+pymysql://{settings.DB_USERNAME}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}"
-
-    # SQLite (if needed in future)
-    elif connection == "sqlite":
-        return f"sqlite:///{settings.DB_DATABASE}"
-
-    # Default: use the connection string as-is
-    else:
-        return f"{settings.DB_CONNECTION}://{settings.DB_USERNAME}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}"
-
-
-def get_connect_args():
-    """
-    Get connection arguments for migrations based on database type.
-    """
-    connection = settings.DB_CONNECTION.lower()
-    connect_args = {}
-
-    # MySQL-specific: Unix socket (for MAMP or local MySQL)
-    if connection in ["mysql", "mysql+pymysql"]:
-        if hasattr(settings, "DB_UNIX_SOCKET") and settings.DB_UNIX_SOCKET:
-            connect_args["unix_socket"] = settings.DB_UNIX_SOCKET
-
-    # PostgreSQL-specific: SSL mode
-    if connection in ["postgresql", "postgres"]:
-        if hasattr(settings, "DB_SSL_MODE") and settings.DB_SSL_MODE:
-            connect_args["sslmode"] = settings.DB_SSL_MODE
-
-    return connect_args
-
-
 def run_migrations_offline():
-    url = get_url()
     context.configure(
-        url=url,
+        url=settings.database_url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -78,7 +33,7 @@ def run_migrations_offline():
 
 def run_migrations_online():
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = get_url()
+    configuration["sqlalchemy.url"] = settings.database_url
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
@@ -92,7 +47,6 @@ def run_migrations_online():
         with context.begin_transaction():
             context.run_migrations()
 
-
 if context.is_offline_mode():
     run_migrations_offline()
 else:
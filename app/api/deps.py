@@ -0,0 +1,16 @@
+"""
+API Dependencies
+Annotated dependency aliases shared by the controllers, e.g. ``db: DB``.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+
+DB = Annotated[Session, Depends(get_db)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
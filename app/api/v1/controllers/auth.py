@@ -1,13 +1,13 @@
 from datetime import timedelta
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
+from app.api.deps import DB
 from app.core import security
 from app.core.broadcasting import broadcast
-from app.core.database import get_db
+from app.core.celery_app import celery_app
 from app.events.user_events import UserCreated
 from app.jobs.tasks import process_user_data, send_welcome_email
 from app.models.user import User
@@ -18,9 +18,21 @@ from config import settings
 router = APIRouter()
 
 
+def _after_register(user_id: int, event: UserCreated) -> None:
+    """
+    Queue the new user's jobs and broadcast the event.
+    Runs after the response is sent; both jobs share one broker connection.
+    """
+    with celery_app.producer_or_acquire() as producer:
+        send_welcome_email.apply_async((user_id,), producer=producer)
+        process_user_data.apply_async((user_id,), producer=producer)
+
+    broadcast().event(event)
+
+
 @router.post("/login", response_model=TokenWithUser)
 def login(
-    db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+    db: DB, form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token and user information for future requests
@@ -45,8 +57,9 @@ def login(
 @router.post("/register", response_model=UserResponse)
 def register(
     *,
-    db: Session = Depends(get_db),
+    db: DB,
     user_in: UserCreate,
+    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Create new user.
@@ -60,12 +73,7 @@ def register(
         )
     user = User.create(db, obj_in=user_in)
 
-    # Queue background tasks
-    send_welcome_email.delay(user.id)
-    process_user_data.delay(user.id)
-
-    # Example: Broadcast user created event
-    event = UserCreated(user)
-    broadcast().event(event)
+    # Queue jobs and broadcast the user created event after the response
+    background_tasks.add_task(_after_register, user.id, UserCreated(user))
 
     return user
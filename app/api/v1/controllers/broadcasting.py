@@ -4,23 +4,30 @@ Handles WebSocket connections for real-time broadcasting.
 """
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
+import uuid
 from typing import Any
 
 from fastapi import (
     APIRouter,
-    Depends,
     HTTPException,
     Query,
     WebSocket,
     WebSocketDisconnect,
 )
+from jose.exceptions import JWTError
 from redis import Redis
 
-from app.core.security import get_current_user
+from app.api.deps import CurrentUser
+from app.core.channels import get_channel_manager
+from app.core.database import SessionLocal
+from app.core.security import decode_access_token
 from app.models.user import User
 from config import settings
+from routes.channels import register_channels
 
 logger = logging.getLogger(__name__)
 
@@ -181,8 +188,6 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = Query(Non
     Similar to Laravel's broadcasting endpoint.
     Requires authentication token.
     """
-    import uuid
-
     socket_id = str(uuid.uuid4())
     user_id = None
 
@@ -193,16 +198,8 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = Query(Non
 
     # Authenticate user
     try:
-        from jose import jwt
-        from jose.exceptions import JWTError
-
-        from app.models.user import User
-        from config import settings
-
         # Decode and validate JWT token
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_access_token(token)
         user_id = payload.get("sub")
 
         if user_id is None:
@@ -211,8 +208,6 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = Query(Non
 
         # Verify user exists
         # Note: We need to get a DB session - for WebSocket, we'll create a temporary one
-        from app.core.database import SessionLocal
-
         db = SessionLocal()
         try:
             user = User.get(db, id=int(user_id))
@@ -278,17 +273,14 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = Query(Non
 
 @router.post("/auth")
 async def authorize_channel(
+    current_user: CurrentUser,
     channel_name: str = Query(...),
     socket_id: str = Query(...),
-    current_user: User = Depends(get_current_user),
 ):
     """
     Authorize private/presence channel access.
     Similar to Laravel's broadcasting/auth endpoint.
     """
-    from app.core.channels import get_channel_manager
-    from routes.channels import register_channels
-
     # Register channels (should be done once, but safe to call multiple times)
     register_channels()
 
@@ -307,9 +299,6 @@ async def authorize_channel(
         raise HTTPException(status_code=403, detail="Unauthorized")
 
     # Generate auth signature (simplified - in production, use proper signing)
-    import hashlib
-    import hmac
-
     message = f"{socket_id}:{channel_name}"
     signature = hmac.new(
         settings.APP_KEY.encode(), message.encode(), hashlib.sha256
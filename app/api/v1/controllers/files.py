@@ -3,13 +3,18 @@ File Storage Endpoints
 Demonstrates Laravel-like file storage usage.
 """
 
-import io
+import itertools
+import os
+import secrets
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from app.api.deps import CurrentUser
 from app.core.file_security import (
     MAX_FILE_SIZE,
     get_file_mime_type,
@@ -19,29 +24,82 @@ from app.core.file_security import (
     validate_file_size,
     validate_mime_type,
 )
-from app.core.security import get_current_user
+from app.core.static_files import etag_matches
 from app.core.storage import storage
-from app.models.user import User
 from config import settings
 
 router = APIRouter()
 
+# Enough leading bytes for magic-number MIME detection
+MIME_SNIFF_SIZE = 2048
+
+# Files sit behind auth, so only the client may cache them; shared caches must not
+FILE_CACHE_CONTROL = "private, max-age=3600"
+
+
+def _validators(info: dict[str, Any]) -> dict[str, str]:
+    """
+    Build ETag/Last-Modified/Cache-Control headers from a storage stat result.
+
+    Args:
+        info: Result of storage().stat()
+
+    Returns:
+        Response headers for conditional requests
+    """
+    modified = info["last_modified"] or 0
+    headers = {
+        "ETag": f'W/"{int(modified * 1_000_000):x}-{info["size"]:x}"',
+        "Cache-Control": FILE_CACHE_CONTROL,
+    }
+    if info["last_modified"] is not None:
+        headers["Last-Modified"] = formatdate(info["last_modified"], usegmt=True)
+    return headers
+
+
+def _is_not_modified(request: Request, info: dict[str, Any], etag: str) -> bool:
+    """
+    Evaluate If-None-Match, falling back to If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Incoming request
+        info: Result of storage().stat()
+        etag: Current ETag of the file
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or info["last_modified"] is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one-second resolution
+    return int(info["last_modified"]) <= since
+
 
 @router.post("/upload")
 async def upload_file(
+    current_user: CurrentUser,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """
     Upload a file to storage with security validation.
     Similar to Laravel's file upload.
     """
     try:
-        # Read file content
-        content = await file.read()
+        # Get the upload size without reading it into memory
+        size = file.file.seek(0, os.SEEK_END)
+        await file.seek(0)
 
         # Validate file size
-        if not validate_file_size(len(content)):
+        if not validate_file_size(size):
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024 * 1024)}MB",
@@ -51,8 +109,10 @@ async def upload_file(
         if not validate_file_extension(file.filename):
             raise HTTPException(status_code=400, detail="File type not allowed")
 
-        # Validate MIME type
-        mime_type = get_file_mime_type(content)
+        # Validate MIME type from the leading bytes only
+        head = await file.read(MIME_SNIFF_SIZE)
+        await file.seek(0)
+        mime_type = get_file_mime_type(head)
         if mime_type and not validate_mime_type(mime_type):
             raise HTTPException(status_code=400, detail="File type not allowed")
 
@@ -60,10 +120,8 @@ async def upload_file(
         safe_filename = sanitize_filename(file.filename)
 
         # Generate unique filename
-        import uuid
-
         file_ext = Path(safe_filename).suffix
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
+        unique_filename = f"{secrets.token_hex(16)}{file_ext}"
 
         # Ensure path is within user's directory
         file_path = f"uploads/{current_user.id}/{unique_filename}"
@@ -72,8 +130,8 @@ async def upload_file(
         base_dir = settings.FILESYSTEM_ROOT
         validated_path = validate_file_path(file_path, base_dir)
 
-        # Store file using storage facade
-        success = storage().put(file_path, content)
+        # Stream file into storage using storage facade
+        success = await run_in_threadpool(storage().put_stream, file_path, file.file)
 
         if not success:
             raise HTTPException(status_code=500, detail="Failed to store file")
@@ -83,7 +141,7 @@ async def upload_file(
             "path": file_path,
             "filename": safe_filename,
             "url": storage().url(file_path),
-            "size": len(content),
+            "size": size,
         }
     except HTTPException:
         raise
@@ -96,7 +154,8 @@ async def upload_file(
 @router.get("/download/{file_path:path}")
 async def download_file(
     file_path: str,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user: CurrentUser,
 ) -> Any:
     """
     Download a file from storage with path validation.
@@ -107,25 +166,33 @@ async def download_file(
         validated_path = validate_file_path(file_path, base_dir)
 
         # Ensure file exists
-        if not storage().exists(file_path):
+        info = storage().stat(file_path)
+        if info is None:
             raise HTTPException(status_code=404, detail="File not found")
 
-        # Get file content
-        content = storage().get(file_path)
-        if content is None:
-            raise HTTPException(status_code=404, detail="File not found")
+        # Client copy is current: answer before opening the file
+        headers = _validators(info)
+        if _is_not_modified(request, info, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        # Stream file content; the first chunk is also used for MIME detection
+        chunks = storage().read_stream(file_path)
+        first_chunk = await run_in_threadpool(next, chunks, b"")
 
         # Get filename from path (sanitized)
         filename = sanitize_filename(file_path.split("/")[-1])
 
         # Detect MIME type
-        mime_type = get_file_mime_type(content) or "application/octet-stream"
+        mime_type = get_file_mime_type(first_chunk) or "application/octet-stream"
 
         # Return file as streaming response
         return StreamingResponse(
-            io.BytesIO(content),
+            itertools.chain((first_chunk,), chunks),
             media_type=mime_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            headers={
+                **headers,
+                "Content-Disposition": f"attachment; filename={filename}",
+            },
         )
     except HTTPException:
         raise
@@ -137,7 +204,8 @@ async def download_file(
 @router.get("/info/{file_path:path}")
 async def get_file_info(
     file_path: str,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user: CurrentUser,
 ) -> Any:
     """
     Get file information with path validation.
@@ -147,17 +215,17 @@ async def get_file_info(
         base_dir = settings.FILESYSTEM_ROOT
         validated_path = validate_file_path(file_path, base_dir)
 
-        if not storage().exists(file_path):
+        info = storage().stat(file_path)
+        if info is None:
             raise HTTPException(status_code=404, detail="File not found")
 
-        return {
-            "path": file_path,
-            "exists": True,
-            "size": storage().size(file_path),
-            "mime_type": storage().mime_type(file_path),
-            "last_modified": storage().last_modified(file_path),
-            "url": storage().url(file_path),
-        }
+        headers = _validators(info)
+        if _is_not_modified(request, info, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        return ORJSONResponse(
+            {"path": file_path, "exists": True, **info}, headers=headers
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -168,7 +236,7 @@ async def get_file_info(
 @router.delete("/delete/{file_path:path}")
 async def delete_file(
     file_path: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Delete a file from storage with path validation.
@@ -196,8 +264,8 @@ async def delete_file(
 
 @router.get("/list")
 async def list_files(
+    current_user: CurrentUser,
     directory: str = "",
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """
     List files in a directory.
@@ -219,7 +287,7 @@ async def list_files(
 async def copy_file(
     from_path: str,
     to_path: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Copy a file from one location to another.
@@ -248,7 +316,7 @@ async def copy_file(
 async def move_file(
     from_path: str,
     to_path: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Move a file from one location to another.
@@ -1,27 +1,30 @@
-import json
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
 
+from app.api.deps import DB, CurrentUser
 from app.core.broadcasting import broadcast
 from app.core.cache import cache
-from app.core.database import get_db
 from app.core.policies import UserPolicy
-from app.core.security import get_current_user
 from app.events.user_events import UserDeleted, UserUpdated
 from app.models.user import User
-from app.schemas.user import UserResponse, UserUpdate
+from app.schemas.user import UserPage, UserResponse, UserUpdate
 
 router = APIRouter()
 
+# read_user caches the response body as raw JSON; the ":json" suffix keeps it
+# apart from pickled values that cache().put/remember store under "user:{id}"
+USER_JSON_CACHE_KEY = "user:{}:json"
+
 
 @router.get("/me", response_model=UserResponse)
-def read_user_me(
-    current_user: User = Depends(get_current_user),
+async def read_user_me(
+    current_user: CurrentUser,
 ) -> Any:
     """
     Get current user.
+    No I/O of its own, so it runs on the event loop instead of the threadpool;
+    endpoints that query the (sync) database stay plain ``def``.
     """
     return current_user
 
@@ -29,9 +32,9 @@ def read_user_me(
 @router.put("/me", response_model=UserResponse)
 def update_user_me(
     *,
-    db: Session = Depends(get_db),
+    db: DB,
     user_in: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser,
 ) -> Any:
     """
     Update own user (with cache invalidation and broadcasting example).
@@ -40,7 +43,7 @@ def update_user_me(
     user = User.update(db, db_obj=current_user, obj_in=user_in)
 
     # Example: Invalidate cache after update
-    cache().forget(f"user:{user.id}")
+    cache().forget(USER_JSON_CACHE_KEY.format(user.id))
 
     # Example: Broadcast user update event
     event = UserUpdated(user)
@@ -49,78 +52,70 @@ def update_user_me(
     return user
 
 
-@router.get("/", response_model=list[UserResponse])
+@router.get("/", response_model=UserPage)
 def read_users(
-    db: Session = Depends(get_db),
-    skip: int = 0,
+    db: DB,
+    current_user: CurrentUser,
+    after_id: int | None = None,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
 ) -> Any:
     """
-    Retrieve users.
+    Retrieve users, ordered by id.
+    Pass the previous page's next_after as after_id to get the next page.
     """
     UserPolicy.view_any(current_user)
-    users = User.get_multi(db, skip=skip, limit=limit)
-    return users
+    users = User.get_multi_rows(db, after_id=after_id, limit=limit)
+    next_after = users[-1].id if users and len(users) == limit else None
+    return {"items": users, "next_after": next_after}
 
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get("/{user_id}", response_model=None, responses={200: {"model": UserResponse}})
 def read_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: DB,
+    current_user: CurrentUser,
 ) -> Any:
     """
     Get a specific user (with caching example).
     """
     UserPolicy.view(current_user, user_id)
 
-    # Example: Cache user data for 5 minutes
-    cache_key = f"user:{user_id}"
-    
-    def get_user_data():
-        user = User.get(db, id=user_id)
-        if user:
-            # Convert User model to UserResponse schema and serialize to JSON-compatible dict
-            # Using model_dump_json() ensures datetime objects are properly serialized
-            user_response = UserResponse.model_validate(user)
-            return json.loads(user_response.model_dump_json())
-        return None
-    
-    user_data = cache().remember(
-        cache_key,
-        ttl=300,  # 5 minutes
-        callback=get_user_data,
-    )
-
-    if not user_data:
+    # Example: Cache the serialized user for 5 minutes. The cached bytes are
+    # already the response body, so a hit skips Pydantic entirely.
+    cache_key = USER_JSON_CACHE_KEY.format(user_id)
+    cached = cache().get_raw(cache_key)
+    if cached is not None:
+        return Response(
+            content=cached, media_type="application/json", headers={"X-Cache": "HIT"}
+        )
+
+    user = User.get(db, id=user_id)
+    if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return user_data
+    payload = UserResponse.model_validate(user).model_dump_json().encode()
+    cache().put_raw(cache_key, payload, ttl=300)  # 5 minutes
+    return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/{user_id}", response_model=UserResponse)
 def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: DB,
+    current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Delete a user (with cache invalidation and broadcasting example).
     """
-    user = User.get(db, id=user_id)
-   
+    UserPolicy.delete(current_user, user_id)
+
+    user = User.destroy(db, id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    UserPolicy.delete(current_user, user.id)
 
-    # Example: Invalidate cache before deletion
-    cache().forget(f"user:{user_id}")
-
-    # Example: Broadcast user deletion event
-    event = UserDeleted(user_id)
-    broadcast().event(event)
+    # Example: Invalidate cache and broadcast the deletion after the response
+    background_tasks.add_task(cache().forget, USER_JSON_CACHE_KEY.format(user_id))
+    background_tasks.add_task(broadcast().event, UserDeleted(user_id))
 
-    db.delete(user)
-    db.commit()
     return user
@@ -5,73 +5,51 @@ Laravel-like command structure for FastAPI Boilerplate
 
 import click
 
-from app.console.commands.cache import clear_cache
-from app.console.commands.database import db_create, db_drop
-from app.console.commands.key_generate import key_generate
-from app.console.commands.install import install
-from app.console.commands.logs import clear_logs, view_logs
-from app.console.commands.make import (
-    make_controller,
-    make_exception,
-    make_middleware,
-    make_model,
-    make_repository,
-    make_schema,
-    make_seeder,
-    make_service,
-    make_validator,
-)
-from app.console.commands.migration import (
-    make_migration,
-    migrate,
-    migrate_refresh,
-    migrate_reset,
-    migrate_rollback,
-    migrate_status,
-)
-from app.console.commands.schedule import schedule_list, schedule_run
-from app.console.commands.seeder import db_refresh, db_seed
-from app.console.commands.serve import serve
-from app.console.commands.test import test
-from app.console.commands.user import list_users, promote_user
+from app.console.lazy_group import LazyGroup
 
+# Command name -> (module, attribute); modules are imported on first use
+COMMANDS = {
+    "serve": ("app.console.commands.serve", "serve"),
+    "install": ("app.console.commands.install", "install"),
+    "key:generate": ("app.console.commands.key_generate", "key_generate"),
+    "make:migration": ("app.console.commands.migration", "make_migration"),
+    "migrate": ("app.console.commands.migration", "migrate"),
+    "migrate:status": ("app.console.commands.migration", "migrate_status"),
+    "migrate:rollback": ("app.console.commands.migration", "migrate_rollback"),
+    "migrate:reset": ("app.console.commands.migration", "migrate_reset"),
+    "migrate:refresh": ("app.console.commands.migration", "migrate_refresh"),
+    "make:model": ("app.console.commands.make", "make_model"),
+    "make:controller": ("app.console.commands.make", "make_controller"),
+    "make:service": ("app.console.commands.make", "make_service"),
+    "make:schema": ("app.console.commands.make", "make_schema"),
+    "test": ("app.console.commands.test", "test"),
+    "cache:clear": ("app.console.commands.cache", "clear_cache"),
+    "logs:view": ("app.console.commands.logs", "view_logs"),
+    "logs:clear": ("app.console.commands.logs", "clear_logs"),
+    "make:middleware": ("app.console.commands.make", "make_middleware"),
+    "make:exception": ("app.console.commands.make", "make_exception"),
+    "make:validator": ("app.console.commands.make", "make_validator"),
+    "make:repository": ("app.console.commands.make", "make_repository"),
+    "make:seeder": ("app.console.commands.make", "make_seeder"),
+    "db:seed": ("app.console.commands.seeder", "db_seed"),
+    "db:refresh": ("app.console.commands.seeder", "db_refresh"),
+    "db-create": ("app.console.commands.database", "db_create"),
+    "db:drop": ("app.console.commands.database", "db_drop"),
+    "schedule:run": ("app.console.commands.schedule", "schedule_run"),
+    "schedule:list": ("app.console.commands.schedule", "schedule_list"),
+    "user:promote": ("app.console.commands.user", "promote_user"),
+    "user:list": ("app.console.commands.user", "list_users"),
+}
 
-@click.group()
-def app():
+
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS)
+@click.option("--no-cache", is_flag=True, help="Don't use the compiled template cache")
+def app(no_cache: bool):
     """FastAPI Boilerplate CLI"""
-    pass
+    if no_cache:
+        from app.console.jinja_env import ENV
 
+        ENV.bytecode_cache = None
 
-# Register all commands
-app.add_command(serve)
-app.add_command(install)
-app.add_command(key_generate)
-app.add_command(make_migration)
-app.add_command(migrate)
-app.add_command(migrate_status)
-app.add_command(migrate_rollback)
-app.add_command(migrate_reset)
-app.add_command(migrate_refresh)
-app.add_command(make_model)
-app.add_command(make_controller)
-app.add_command(make_service)
-app.add_command(make_schema)
-app.add_command(test)
-app.add_command(clear_cache)
-app.add_command(view_logs)
-app.add_command(clear_logs)
-app.add_command(make_middleware)
-app.add_command(make_exception)
-app.add_command(make_validator)
-app.add_command(make_repository)
-app.add_command(make_seeder)
-app.add_command(db_seed)
-app.add_command(db_refresh)
-app.add_command(db_create)
-app.add_command(db_drop)
-app.add_command(schedule_run)
-app.add_command(schedule_list)
-app.add_command(promote_user)
-app.add_command(list_users)
 
 __all__ = ["app"]
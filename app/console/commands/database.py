@@ -7,8 +7,6 @@ import sys
 
 import click
 
-from config import settings
-
 
 @click.command()
 @click.option(
@@ -16,6 +14,8 @@ from config import settings
 )
 def db_create(database):
     """Create the database if it doesn't exist."""
+    from config import settings
+
     db_name = database or settings.DB_DATABASE
     connection = settings.DB_CONNECTION.lower()
 
@@ -115,6 +115,8 @@ def db_create(database):
 @click.confirmation_option(prompt="Are you sure you want to drop the database?")
 def db_drop(database):
     """Drop the database."""
+    from config import settings
+
     db_name = database or settings.DB_DATABASE
     connection = settings.DB_CONNECTION.lower()
 
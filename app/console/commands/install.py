@@ -1,11 +1,12 @@
 """Install command"""
 
-import os
 import shutil
 from pathlib import Path
 
 import click
 
+from app.console.process import run_command
+
 
 @click.command(name="install")
 @click.option("--force", is_flag=True, help="Force the installation even if .env exists")
@@ -35,8 +36,10 @@ def install(force: bool):
     # 3. Run Migrations
     if click.confirm("Do you want to run database migrations?", default=True):
         click.echo("inst Running migrations...")
-        os.system("alembic upgrade head")
-        click.echo("✅ Migrations completed.")
+        if run_command("alembic", "upgrade", "head") == 0:
+            click.echo("✅ Migrations completed.")
+        else:
+            click.echo("❌ Migrations failed.")
 
     # 4. Create Storage Directories
     click.echo("📁 Creating storage directories...")
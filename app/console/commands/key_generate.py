@@ -1,6 +1,5 @@
 """Key Generate command"""
 
-import secrets
 from pathlib import Path
 
 import click
@@ -8,6 +7,8 @@ import click
 
 def generate_and_persist_key() -> str:
     """Generate a new application key and save it to .env"""
+    import secrets
+
     key = secrets.token_hex(32)
     env_path = Path(".env")
     
@@ -1,5 +1,8 @@
 """Log commands"""
 
+import os
+import shutil
+import sys
 from pathlib import Path
 
 import click
@@ -13,16 +16,36 @@ def view_logs():
         click.echo("No logs found!")
         return
 
-    with open(log_path) as f:
-        click.echo(f.read())
+    # Stream the raw bytes; the log can be far larger than we want in memory
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    with open(log_path, "rb") as f:
+        offset = 0
+        if hasattr(os, "sendfile"):
+            # Zero-copy in the kernel where stdout allows it (file, pipe, ...)
+            try:
+                size = os.fstat(f.fileno()).st_size
+                while offset < size:
+                    sent = os.sendfile(out.fileno(), f.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                pass
+        # Whatever sendfile didn't cover (or everything, if it's unavailable)
+        f.seek(offset)
+        shutil.copyfileobj(f, out)
+    out.flush()
 
 
 @click.command(name="logs:clear")
 def clear_logs():
     """Clear application logs"""
     log_path = Path("logs/app.log")
-    if log_path.exists():
-        log_path.write_text("")
-        click.echo("Logs cleared successfully!")
-    else:
+    try:
+        # One truncate(2); a logger holding the file open keeps its handle
+        os.truncate(log_path, 0)
+    except FileNotFoundError:
         click.echo("No logs found!")
+    else:
+        click.echo("Logs cleared successfully!")
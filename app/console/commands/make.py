@@ -1,21 +1,45 @@
 """Make commands - Generate various files"""
 
-import os
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 import click
 
-from app.console.templates.controller import (
-    API_CONTROLLER_TEMPLATE,
-    BASIC_CONTROLLER_TEMPLATE,
-    RESOURCE_CONTROLLER_TEMPLATE,
-)
-from app.console.templates.model import MODEL_TEMPLATE
-from app.console.templates.seeder import SEEDER_TEMPLATE
-from app.console.templates.service import (
-    SERVICE_TEMPLATE,
-    SERVICE_WITH_INTERFACE_TEMPLATE,
-)
+from app.console.process import start_command
+
+
+@cache
+def _template(name: str) -> Any:
+    """Load a generator template once per process (Jinja is imported lazily)."""
+    from app.console.jinja_env import ENV
+
+    return ENV.get_template(name)
+
+
+def _controller_template(api: bool, resource: bool) -> str:
+    """Pick the controller template for the --api / --resource flags."""
+    if api:
+        return "api_controller.py.j2"
+    if resource:
+        return "resource_controller.py.j2"
+    return "basic_controller.py.j2"
+
+
+def _write(template: str, path: Path, **context: Any) -> None:
+    """Stream a generator template into path."""
+    _template(template).stream(**context).dump(str(path), encoding="utf-8")
+
+
+# Directories already created in this process (make:model --all hits several)
+_ENSURED: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process."""
+    if path not in _ENSURED:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(path)
 
 
 @click.command(name="make:model")
@@ -27,7 +51,10 @@ from app.console.templates.service import (
     is_flag=True,
     help="Create all components (model, migration, controller, service, schema)",
 )
-def make_model(name: str, migration: bool, controller: bool, all: bool):
+@click.pass_context
+def make_model(
+    ctx: click.Context, name: str, migration: bool, controller: bool, all: bool
+):
     """Create a new model file"""
     model_name = name.lower()
     model_class = name.capitalize()
@@ -38,37 +65,62 @@ def make_model(name: str, migration: bool, controller: bool, all: bool):
         click.echo(f"Model {name} already exists!")
         return
 
-    model_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(model_path.parent)
 
     # Create model file
-    model_content = MODEL_TEMPLATE.format(
-        model_name=model_name, model_class=model_class
-    )
-    model_path.write_text(model_content)
+    _write("model.py.j2", model_path, model_name=model_name, model_class=model_class)
     click.echo(f"Model {name} created successfully!")
     click.echo(f"Model: file://{model_path.absolute()}")
 
-    # Create migration if requested
+    # Start the migration first: alembic's startup and autogenerate run while
+    # the other files are generated (the model file is already on disk)
+    alembic = None
     if migration or all:
-        os.system(f'alembic revision --autogenerate -m "create {model_name} model"')
-        migration_path = Path("alembic/versions")
-        latest_migration = (
-            sorted(migration_path.glob("*.py"))[-1] if migration_path.exists() else None
+        alembic = start_command(
+            "alembic", "revision", "--autogenerate", "-m", f"create {model_name} model"
         )
-        if latest_migration:
-            click.echo(f"Migration: file://{latest_migration.absolute()}")
 
+    # Generators run in this process on the current context (no ./artisan
+    # re-entry, no argument re-parsing)
     # Create controller if requested
     if controller or all:
-        os.system(f"./artisan make:controller {model_class}Controller --resource")
+        ctx.invoke(
+            make_controller, name=f"{model_class}Controller", resource=True, api=False
+        )
 
     # Create all components if requested
     if all:
         # Create service
-        os.system(f"./artisan make:service {model_class}Service --interface")
+        ctx.invoke(make_service, name=f"{model_class}Service", interface=True)
 
         # Create schema
-        os.system(f"./artisan make:schema {model_class}")
+        ctx.invoke(make_schema, name=model_class)
+
+    if migration or all:
+        if alembic is None:
+            raise SystemExit(127)
+        # Alembic's output was held back so it doesn't interleave with the
+        # generators above; show it now, next to its result
+        output, _ = alembic.communicate()
+        click.echo(output, nl=False)
+        if alembic.returncode != 0:
+            click.echo(
+                f"❌ Migration for model {name} failed "
+                f"(alembic exited with {alembic.returncode})",
+                err=True,
+            )
+            raise SystemExit(alembic.returncode)
+
+        # Revision file names start with a random id, so the newest file is the
+        # one just generated; a single max() pass, no sorted list
+        migration_path = Path("alembic/versions")
+        latest_migration = max(
+            migration_path.glob("*.py"),
+            key=lambda path: path.stat().st_mtime_ns,
+            default=None,
+        )
+        if latest_migration:
+            click.echo(f"Migration: file://{latest_migration.absolute()}")
 
 
 @click.command(name="make:controller")
@@ -88,24 +140,16 @@ def make_controller(name: str, resource: bool, api: bool):
         return
 
     # Create controllers directory if it doesn't exist
-    controller_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(controller_path.parent)
 
-    # Choose template based on flags
-    if api:
-        template = API_CONTROLLER_TEMPLATE
-    elif resource:
-        template = RESOURCE_CONTROLLER_TEMPLATE
-    else:
-        template = BASIC_CONTROLLER_TEMPLATE
-
-    # Format template with variables
-    controller_content = template.format(
+    # Render template with variables
+    _write(
+        _controller_template(api, resource),
+        controller_path,
         model_name=model_name,
         model_class=model_class,
         controller_class=controller_class,
     )
-
-    controller_path.write_text(controller_content)
     click.echo(f"Controller {name} created successfully!")
     click.echo(f"Controller: file://{controller_path.absolute()}")
 
@@ -126,17 +170,17 @@ def make_service(name: str, interface: bool):
         return
 
     # Create services directory if it doesn't exist
-    service_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Choose template based on interface flag
-    template = SERVICE_WITH_INTERFACE_TEMPLATE if interface else SERVICE_TEMPLATE
+    _ensure_dir(service_path.parent)
 
-    # Format template with variables
-    service_content = template.format(
-        model_name=model_name, model_class=model_class, service_class=service_class
+    # Render template with variables (the interface is a flag in the template)
+    _write(
+        "service.py.j2",
+        service_path,
+        model_name=model_name,
+        model_class=model_class,
+        service_class=service_class,
+        interface=interface,
     )
-
-    service_path.write_text(service_content)
     click.echo(f"Service {name} created successfully!")
     click.echo(f"Service: file://{service_path.absolute()}")
 
@@ -145,30 +189,17 @@ def make_service(name: str, interface: bool):
 @click.argument("name")
 def make_schema(name: str):
     """Create a new schema file"""
-    schema_path = Path("app/schemas") / f"{name.lower()}.py"
+    model_name = name.lower()
+    model_class = name.capitalize()
+
+    schema_path = Path("app/schemas") / f"{model_name}.py"
     if schema_path.exists():
         click.echo(f"Schema {name} already exists!")
         return
 
-    schema_content = f"""from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+    _ensure_dir(schema_path.parent)
 
-class {name.capitalize()}Base(BaseModel):
-    pass
-
-class {name.capitalize()}Create({name.capitalize()}Base):
-    pass
-
-class {name.capitalize()}Response({name.capitalize()}Base):
-    id: int
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
-"""
-    schema_path.write_text(schema_content)
+    _write("schema.py.j2", schema_path, model_name=model_name, model_class=model_class)
     click.echo(f"Schema {name} created successfully!")
 
 
@@ -176,24 +207,22 @@ class {name.capitalize()}Response({name.capitalize()}Base):
 @click.argument("name")
 def make_middleware(name: str):
     """Create a new middleware file"""
-    middleware_path = Path("app/http/middleware") / f"{name.lower()}.py"
+    model_name = name.lower()
+    model_class = name.capitalize()
+
+    middleware_path = Path("app/http/middleware") / f"{model_name}.py"
     if middleware_path.exists():
         click.echo(f"Middleware {name} already exists!")
         return
 
-    middleware_path.parent.mkdir(parents=True, exist_ok=True)
-
-    middleware_content = f"""from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+    _ensure_dir(middleware_path.parent)
 
-class {name.capitalize()}Middleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Process request
-        response = await call_next(request)
-        # Process response
-        return response
-"""
-    middleware_path.write_text(middleware_content)
+    _write(
+        "middleware.py.j2",
+        middleware_path,
+        model_name=model_name,
+        model_class=model_class,
+    )
     click.echo(f"Middleware {name} created successfully!")
 
 
@@ -201,23 +230,22 @@ class {name.capitalize()}Middleware(BaseHTTPMiddleware):
 @click.argument("name")
 def make_exception(name: str):
     """Create a new exception file"""
-    exception_path = Path("app/exceptions") / f"{name.lower()}.py"
+    model_name = name.lower()
+    model_class = name.capitalize()
+
+    exception_path = Path("app/exceptions") / f"{model_name}.py"
     if exception_path.exists():
         click.echo(f"Exception {name} already exists!")
         return
 
-    exception_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(exception_path.parent)
 
-    exception_content = f"""from fastapi import HTTPException, status
-
-class {name.capitalize()}Exception(HTTPException):
-    def __init__(self, detail: str = None):
-        super().__init__(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=detail or "An error occurred"
-        )
-"""
-    exception_path.write_text(exception_content)
+    _write(
+        "exception.py.j2",
+        exception_path,
+        model_name=model_name,
+        model_class=model_class,
+    )
     click.echo(f"Exception {name} created successfully!")
 
 
@@ -225,23 +253,22 @@ class {name.capitalize()}Exception(HTTPException):
 @click.argument("name")
 def make_validator(name: str):
     """Create a new validator file"""
-    validator_path = Path("app/validators") / f"{name.lower()}.py"
+    model_name = name.lower()
+    model_class = name.capitalize()
+
+    validator_path = Path("app/validators") / f"{model_name}.py"
     if validator_path.exists():
         click.echo(f"Validator {name} already exists!")
         return
 
-    validator_path.parent.mkdir(parents=True, exist_ok=True)
-
-    validator_content = f"""from pydantic import BaseModel, field_validator
+    _ensure_dir(validator_path.parent)
 
-class {name.capitalize()}Validator(BaseModel):
-    @field_validator('*')
-    @classmethod
-    def validate_fields(cls, v):
-        # Add your validation logic here
-        return v
-"""
-    validator_path.write_text(validator_content)
+    _write(
+        "validator.py.j2",
+        validator_path,
+        model_name=model_name,
+        model_class=model_class,
+    )
     click.echo(f"Validator {name} created successfully!")
 
 
@@ -249,48 +276,22 @@ class {name.capitalize()}Validator(BaseModel):
 @click.argument("name")
 def make_repository(name: str):
     """Create a new repository file"""
-    repository_path = Path("app/repositories") / f"{name.lower()}.py"
+    model_name = name.lower()
+    model_class = name.capitalize()
+
+    repository_path = Path("app/repositories") / f"{model_name}.py"
     if repository_path.exists():
         click.echo(f"Repository {name} already exists!")
         return
 
-    repository_path.parent.mkdir(parents=True, exist_ok=True)
-
-    repository_content = f"""from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.{name.lower()} import {name.capitalize()}
-from app.schemas.{name.lower()} import {name.capitalize()}Create, {name.capitalize()}Update
-
-class {name.capitalize()}Repository:
-    def __init__(self, db: Session):
-        self.db = db
-
-    def get_all(self) -> List[{name.capitalize()}]:
-        return self.db.query({name.capitalize()}).all()
-
-    def get_by_id(self, id: int) -> Optional[{name.capitalize()}]:
-        return self.db.query({name.capitalize()}).filter({name.capitalize()}.id == id).first()
-
-    def create(self, obj_in: {name.capitalize()}Create) -> {name.capitalize()}:
-        db_obj = {name.capitalize()}(**obj_in.model_dump())
-        self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
-        return db_obj
-
-    def update(self, db_obj: {name.capitalize()}, obj_in: {name.capitalize()}Update) -> {name.capitalize()}:
-        update_data = obj_in.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
-        self.db.commit()
-        self.db.refresh(db_obj)
-        return db_obj
-
-    def delete(self, db_obj: {name.capitalize()}) -> None:
-        self.db.delete(db_obj)
-        self.db.commit()
-"""
-    repository_path.write_text(repository_content)
+    _ensure_dir(repository_path.parent)
+
+    _write(
+        "repository.py.j2",
+        repository_path,
+        model_name=model_name,
+        model_class=model_class,
+    )
     click.echo(f"Repository {name} created successfully!")
 
 
@@ -309,12 +310,15 @@ def make_seeder(name: str):
         return
 
     # Create seeders directory if it doesn't exist
-    seeder_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(seeder_path.parent)
 
     # Create seeder file
-    seeder_content = SEEDER_TEMPLATE.format(
-        model_name=model_name, model_class=model_class, seeder_class=seeder_class
+    _write(
+        "seeder.py.j2",
+        seeder_path,
+        model_name=model_name,
+        model_class=model_class,
+        seeder_class=seeder_class,
     )
-    seeder_path.write_text(seeder_content)
     click.echo(f"Seeder {name} created successfully!")
     click.echo(f"Seeder: file://{seeder_path.absolute()}")
@@ -1,9 +1,9 @@
 """Migration commands"""
 
-import os
-
 import click
 
+from app.console.process import run_command, run_commands
+
 
 @click.command(name="make:migration")
 @click.argument("message", required=False)
@@ -11,37 +11,45 @@ def make_migration(message: str = None):
     """Create a new database migration"""
     if not message:
         message = click.prompt("Enter migration message")
-    os.system(f'alembic revision --autogenerate -m "{message}"')
+    argv = ("alembic", "revision", "--autogenerate", "-m", message)
+    if code := run_command(*argv):
+        raise SystemExit(code)
 
 
 @click.command(name="migrate")
 def migrate():
     """Run database migrations"""
-    os.system("alembic upgrade head")
+    if code := run_command("alembic", "upgrade", "head"):
+        raise SystemExit(code)
 
 
 @click.command(name="migrate:status")
 def migrate_status():
     """Show the status of database migrations"""
-    os.system("alembic current")
+    if code := run_command("alembic", "current"):
+        raise SystemExit(code)
 
 
 @click.command(name="migrate:rollback")
 def migrate_rollback():
     """Rollback the last database migration"""
-    os.system("alembic downgrade -1")
+    if code := run_command("alembic", "downgrade", "-1"):
+        raise SystemExit(code)
 
 
 @click.command(name="migrate:reset")
 def migrate_reset():
     """Reset database (rollback all migrations)"""
-    os.system("alembic downgrade base")
+    if code := run_command("alembic", "downgrade", "base"):
+        raise SystemExit(code)
     click.echo("Database reset successfully!")
 
 
 @click.command(name="migrate:refresh")
 def migrate_refresh():
     """Refresh database (rollback + migrate)"""
-    os.system("alembic downgrade base")
-    os.system("alembic upgrade head")
+    if code := run_commands(
+        ("alembic", "downgrade", "base"), ("alembic", "upgrade", "head")
+    ):
+        raise SystemExit(code)
     click.echo("Database refreshed successfully!")
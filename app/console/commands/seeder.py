@@ -1,9 +1,12 @@
 """Seeder commands"""
 
+import importlib
 from pathlib import Path
 
 import click
 
+from app.console.process import run_commands
+
 
 @click.command(name="db:seed")
 @click.option("--seeder", help="Run specific seeder")
@@ -25,22 +28,24 @@ def db_seed(seeder: str = None):
         seeder_module = f"database.seeders.{seeder.lower()}"
         seeder_class = seeder
         try:
-            module = __import__(seeder_module, fromlist=[seeder_class])
+            module = importlib.import_module(seeder_module)
             seeder_instance = getattr(module, seeder_class)()
             count = seeder_instance.run()
             click.echo(f"Seeder {seeder} ran successfully! Created {count} records.")
         except Exception as e:
             click.echo(f"Error running seeder {seeder}: {str(e)}")
     else:
-        # Run all seeders
-        for seeder_file in seeders_path.glob("*.py"):
-            if seeder_file.name == "__init__.py":
+        # Run all seeders (iter_modules skips __init__ and yields sorted names)
+        import pkgutil
+
+        for module_info in pkgutil.iter_modules([str(seeders_path)]):
+            if module_info.ispkg:
                 continue
 
-            seeder_name = seeder_file.stem.capitalize()
-            seeder_module = f"database.seeders.{seeder_file.stem}"
+            seeder_name = module_info.name.capitalize()
+            seeder_module = f"database.seeders.{module_info.name}"
             try:
-                module = __import__(seeder_module, fromlist=[seeder_name])
+                module = importlib.import_module(seeder_module)
                 seeder_instance = getattr(module, seeder_name)()
                 count = seeder_instance.run()
                 click.echo(
@@ -51,15 +56,16 @@ def db_seed(seeder: str = None):
 
 
 @click.command(name="db:refresh")
-def db_refresh():
+@click.pass_context
+def db_refresh(ctx: click.Context):
     """Refresh database (migrate:fresh + seed)"""
-    import os
-
     # Run fresh migrations
-    os.system("alembic downgrade base")
-    os.system("alembic upgrade head")
+    if code := run_commands(
+        ("alembic", "downgrade", "base"), ("alembic", "upgrade", "head")
+    ):
+        raise SystemExit(code)
 
-    # Run seeders
-    os.system("./artisan db:seed")
+    # Run seeders in this process, on the current context
+    ctx.invoke(db_seed)
 
     click.echo("Database refreshed successfully!")
@@ -1,13 +1,16 @@
 """Serve command - Start the development server"""
 
-import os
-
 import click
 
+from app.console.process import run_command
+
 
 @click.command(name="serve")
 @click.option("--reload", is_flag=True, help="Enable auto-reload")
 def serve(reload: bool):
     """Start the development server"""
-    reload_flag = "--reload" if reload else ""
-    os.system(f"uvicorn main:app {reload_flag}")
+    argv = ["uvicorn", "main:app"]
+    if reload:
+        argv.append("--reload")
+    if code := run_command(*argv):
+        raise SystemExit(code)
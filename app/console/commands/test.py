@@ -1,7 +1,5 @@
 """Test command"""
 
-import os
-
 import click
 
 
@@ -9,7 +7,15 @@ import click
 @click.argument("test_path", required=False)
 def test(test_path: str = None):
     """Run tests"""
-    if test_path:
-        os.system(f"pytest {test_path}")
-    else:
-        os.system("pytest")
+    # pytest is a dev dependency, so it's only imported when tests are run
+    try:
+        import pytest
+    except ImportError:
+        click.echo("❌ pytest is not installed", err=True)
+        raise SystemExit(127) from None
+
+    # Run in this process: no second interpreter start-up, and the path is
+    # passed as an argument rather than through a shell
+    args = [test_path] if test_path else []
+    if code := pytest.main(args):
+        raise SystemExit(code)
@@ -4,11 +4,6 @@ import logging
 import sys
 
 import click
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
-
-from app.core.database import SessionLocal
-from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +14,12 @@ logger = logging.getLogger(__name__)
 @click.option("--demote", is_flag=True, help="Demote user from superuser")
 def promote_user(user_id: int, superuser: bool, demote: bool):
     """Promote or demote a user to/from superuser status"""
-    db: Session = SessionLocal()
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from app.core.database import SessionLocal
+    from app.models.user import User
+
+    db = SessionLocal()
     
     try:
         logger.info(f"Attempting to {'demote' if demote else 'promote'} user with ID {user_id}")
@@ -117,7 +117,12 @@ def promote_user(user_id: int, superuser: bool, demote: bool):
 @click.option("--limit", type=int, default=1000, help="Maximum number of users to list")
 def list_users(superuser: bool, limit: int):
     """List all users or filter by superuser status"""
-    db: Session = SessionLocal()
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from app.core.database import SessionLocal
+    from app.models.user import User
+
+    db = SessionLocal()
     
     try:
         logger.info(f"Listing users (superuser_only={superuser}, limit={limit})")
@@ -136,7 +141,7 @@ def list_users(superuser: bool, limit: int):
                 logger.info(f"Found {len(users)} superuser(s)")
                 click.echo("Superusers:")
             else:
-                users = User.get_multi(db, skip=0, limit=limit)
+                users = User.get_multi(db, limit=limit)
                 logger.info(f"Found {len(users)} user(s)")
                 click.echo("All users:")
         except SQLAlchemyError as e:
@@ -0,0 +1,19 @@
+"""
+Console Templates
+Jinja2 environment for the make:* code generators.
+"""
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+# One environment per process: templates are compiled on first use and then
+# served from Jinja's cache (auto_reload off, since they don't change at runtime).
+# Compiled bytecode is also kept on disk, in a private per-user temp directory,
+# so later CLI runs skip parsing; entries are keyed by a checksum of the source.
+ENV = Environment(
+    loader=PackageLoader("app.console", "templates"),
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+    keep_trailing_newline=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
@@ -0,0 +1,40 @@
+"""
+Lazy Command Group
+A click group that imports a command's module only when that command runs.
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are registered by import path.
+    The command module is imported on first lookup, so running one
+    command doesn't import every other command's dependencies.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            lazy_subcommands: Command name -> (module path, attribute name)
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_path, attr_name = self.lazy_subcommands[cmd_name]
+            command = getattr(importlib.import_module(module_path), attr_name)
+            # Cache it so later lookups (e.g. --help listing) skip the import
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -0,0 +1,68 @@
+"""
+Console Processes
+Run external programs (alembic, uvicorn, pytest) from console commands.
+"""
+
+import subprocess
+from collections.abc import Sequence
+
+import click
+
+
+def run_command(*argv: str) -> int:
+    """
+    Run a program directly, without a shell.
+    Arguments are passed as-is, so user input (e.g. a migration message)
+    needs no quoting and cannot inject shell syntax.
+
+    Args:
+        argv: Program and its arguments
+
+    Returns:
+        The program's exit code (127 if it isn't installed)
+    """
+    try:
+        return subprocess.run(argv, check=False).returncode
+    except FileNotFoundError:
+        click.echo(f"❌ Command not found: {argv[0]}", err=True)
+        return 127
+
+
+def start_command(*argv: str) -> subprocess.Popen | None:
+    """
+    Start a program in the background, without a shell.
+    Use this to overlap a slow tool (e.g. alembic startup) with other work.
+    Its stdout and stderr are captured (merged, as text) so they don't
+    interleave with the caller's output; call communicate() on the result
+    to get the output and exit code.
+
+    Args:
+        argv: Program and its arguments
+
+    Returns:
+        The running process, or None if the program isn't installed
+    """
+    try:
+        return subprocess.Popen(
+            argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+    except FileNotFoundError:
+        click.echo(f"❌ Command not found: {argv[0]}", err=True)
+        return None
+
+
+def run_commands(*commands: Sequence[str]) -> int:
+    """
+    Run several programs in order, stopping at the first failure.
+
+    Args:
+        commands: One argv sequence per program
+
+    Returns:
+        Exit code of the last program run
+    """
+    for argv in commands:
+        code = run_command(*argv)
+        if code != 0:
+            return code
+    return 0
@@ -3,11 +3,11 @@ Broadcasting System
 Laravel-like broadcasting using WebSockets and Redis pub/sub.
 """
 
-import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+import orjson
 from redis import Redis
 from redis.exceptions import RedisError
 
@@ -187,8 +187,12 @@ class RedisBroadcastDriver(BroadcastDriver):
                 "socket": None,  # For "to others" functionality
             }
 
-            # Publish to Redis channel
-            redis.publish(f"broadcast:{channel}", json.dumps(message))
+            # Publish to Redis channel. orjson returns bytes, which redis sends
+            # as-is; non-str keys are allowed, as json.dumps allowed them
+            redis.publish(
+                f"broadcast:{channel}",
+                orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS),
+            )
 
             return True
         except RedisError as e:
@@ -16,6 +16,9 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Keys fetched per SCAN step and removed per UNLINK call when flushing
+FLUSH_BATCH_SIZE = 1000
+
 
 class RedisCache:
     """
@@ -145,6 +148,49 @@ class RedisCache:
             logger.error(f"Redis put error for key {key}: {e}")
             return False
 
+    def get_raw(self, key: str) -> bytes | None:
+        """
+        Get the stored bytes without deserializing them.
+        Useful for values that are already in their wire format (e.g. JSON).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes or None
+        """
+        try:
+            return self.redis.get(self._make_key(key))
+        except RedisError as e:
+            logger.error(f"Redis get error for key {key}: {e}")
+            return None
+
+    def put_raw(self, key: str, value: bytes, ttl: int | None = None) -> bool:
+        """
+        Store bytes as-is, bypassing the serializer.
+
+        Args:
+            key: Cache key
+            value: Bytes to store
+            ttl: Time to live in seconds (uses default if None)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            full_key = self._make_key(key)
+            ttl = ttl if ttl is not None else self._default_ttl
+
+            if ttl > 0:
+                self.redis.setex(full_key, ttl, value)
+            else:
+                self.redis.set(full_key, value)
+
+            return True
+        except RedisError as e:
+            logger.error(f"Redis put error for key {key}: {e}")
+            return False
+
     def remember(self, key: str, ttl: int | None, callback: Callable[[], Any]) -> Any:
         """
         Get value from cache or execute callback and store result.
@@ -195,17 +241,19 @@ class RedisCache:
             True if successful
         """
         try:
-            if pattern:
-                full_pattern = self._make_key(pattern)
-                keys = self.redis.keys(full_pattern)
-                if keys:
-                    self.redis.delete(*keys)
-            else:
-                # Clear all keys with prefix
-                pattern = self._make_key("*")
-                keys = self.redis.keys(pattern)
-                if keys:
-                    self.redis.delete(*keys)
+            # Without a pattern, clear all keys with prefix
+            full_pattern = self._make_key(pattern or "*")
+
+            # SCAN instead of KEYS so Redis isn't blocked on a large keyspace,
+            # and UNLINK in batches so memory is reclaimed off the main thread
+            batch = []
+            for key in self.redis.scan_iter(match=full_pattern, count=FLUSH_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= FLUSH_BATCH_SIZE:
+                    self.redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                self.redis.unlink(*batch)
             return True
         except RedisError as e:
             logger.error(f"Redis flush error: {e}")
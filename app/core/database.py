@@ -1,4 +1,5 @@
-from urllib.parse import quote_plus
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -6,32 +7,6 @@ from sqlalchemy.orm import sessionmaker
 from config import settings
 
 
-def get_database_url() -> str:
-    """
-    Construct database URL based on connection type.
-    Supports PostgreSQL and MySQL similar to Laravel's database configuration.
-    """
-    connection = settings.DB_CONNECTION.lower()
-    user = quote_plus(settings.DB_USERNAME)
-    password = quote_plus(settings.DB_PASSWORD)
-
-    # PostgreSQL connection strings
-    if connection in ["postgresql", "postgres"]:
-        return f"postgresql://{user}:{password}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}"
-
-    # MySQL connection strings
-    elif connection in ["mysql", "mysql+pymysql"]:
-        return f"mysql+pymysql://{user}:{password}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}"
-
-    # SQLite (if needed in future)
-    elif connection == "sqlite":
-        return f"sqlite:///{settings.DB_DATABASE}"
-
-    # Default: use the connection string as-is
-    else:
-        return f"{settings.DB_CONNECTION}://{user}:{password}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}"
-
-
 def get_connect_args() -> dict:
     """
     Get connection arguments based on database type.
@@ -40,10 +15,13 @@ def get_connect_args() -> dict:
     connection = settings.DB_CONNECTION.lower()
     connect_args = {}
 
-    # MySQL-specific: Unix socket (for MAMP or local MySQL)
+    # MySQL-specific: Unix socket (for MAMP or local MySQL). Only used if the
+    # socket exists here, so the same .env still connects over TCP elsewhere
+    # (Docker, CI) instead of failing on a missing socket file.
     if connection in ["mysql", "mysql+pymysql"]:
-        if hasattr(settings, "DB_UNIX_SOCKET") and settings.DB_UNIX_SOCKET:
-            connect_args["unix_socket"] = settings.DB_UNIX_SOCKET
+        socket = getattr(settings, "DB_UNIX_SOCKET", None)
+        if socket and os.path.exists(socket):
+            connect_args["unix_socket"] = socket
 
     # PostgreSQL-specific: SSL mode
     if connection in ["postgresql", "postgres"]:
@@ -53,8 +31,8 @@ def get_connect_args() -> dict:
     return connect_args
 
 
-# Construct database URL
-SQLALCHEMY_DATABASE_URL = get_database_url()
+# Database URL (built once on the settings object)
+SQLALCHEMY_DATABASE_URL = settings.database_url
 
 # Create engine with connection pool settings
 engine = create_engine(
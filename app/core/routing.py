@@ -0,0 +1,68 @@
+"""
+Routing
+Dict-indexed dispatch for routes with a fixed path.
+"""
+
+from starlette.routing import (
+    BaseRoute,
+    Match,
+    Mount,
+    Route,
+    Router,
+    WebSocketRoute,
+    get_route_path,
+)
+from starlette.types import Receive, Scope, Send
+
+
+class StaticRouteIndex:
+    """
+    ASGI entry point for a Router that finds fixed-path routes by dict lookup.
+
+    Starlette tries every route in order and each Route.matches() re-derives
+    the path with a regex substitution, so dispatch cost grows with the route
+    count. Routes without path parameters are indexed by their path; one is
+    only taken from the index when no earlier parameterised route or mount
+    could match the same path, so first-match order is unchanged. Anything
+    that isn't a full match from the index (405s, slash redirects, path
+    parameters) falls through to the router's own loop.
+    """
+
+    def __init__(self, router: Router):
+        self.router = router
+        self._index: dict[str, list[BaseRoute]] = {}
+        self._indexed_count = -1
+
+    def _build(self) -> None:
+        index: dict[str, list[BaseRoute]] = {}
+        # Literal prefixes of earlier routes that may match more than one path
+        prefixes: list[str] = []
+        for route in self.router.routes:
+            path = getattr(route, "path", "")
+            if isinstance(route, (Route, WebSocketRoute)) and "{" not in path:
+                if not any(path.startswith(prefix) for prefix in prefixes):
+                    index.setdefault(path, []).append(route)
+            elif isinstance(route, (Route, WebSocketRoute, Mount)):
+                prefixes.append(path.split("{", 1)[0])
+            else:
+                # Host or custom routes: no usable path, index nothing after them
+                prefixes.append("")
+        self._index = index
+        self._indexed_count = len(self.router.routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            # Routes can be added after startup; re-index when the count changes
+            if self._indexed_count != len(self.router.routes):
+                self._build()
+            routes = self._index.get(get_route_path(scope))
+            if routes:
+                for route in routes:
+                    match, child_scope = route.matches(scope)
+                    if match is Match.FULL:
+                        if "router" not in scope:
+                            scope["router"] = self.router
+                        scope.update(child_scope)
+                        await route.handle(scope, receive, send)
+                        return
+        await self.router.app(scope, receive, send)
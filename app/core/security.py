@@ -1,14 +1,19 @@
 import base64
 import hashlib
+import hmac
+import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
+import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
+from jose import jwk, jwt
+from jose.backends.base import Key
 from jose.exceptions import JWTError
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -16,13 +21,50 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
 # Bcrypt has a 72-byte limit. For longer passwords, we pre-hash with SHA-256
 # This allows passwords of any length while maintaining security
 BCRYPT_MAX_LENGTH = 72
 
+# Modular crypt format: "$2b$" + 2-digit cost + "$" + 22-char salt + 31-char hash
+BCRYPT_HASH_LENGTH = 60
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Verified token payloads kept per process; clients resend the same token
+TOKEN_CACHE_SIZE = 1024
+
+HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS* tokens are signed without jose: the encoded header never changes and the
+# keyed HMAC is built once and copied per token. Output is identical to jose's.
+# For decoding, jose gets a prebuilt key object; given the raw secret it would
+# try json.loads on it and construct a new key for every token.
+_jwt_header: bytes | None = None
+_jwt_hmac: hmac.HMAC | None = None
+_jwt_key: Key | str = settings.JWT_SECRET
+if settings.JWT_ALGORITHM in HMAC_DIGESTS:
+    _jwt_key = jwk.construct(settings.JWT_SECRET, settings.JWT_ALGORITHM)
+    _jwt_header = _b64url(
+        json.dumps(
+            {"alg": settings.JWT_ALGORITHM, "typ": "JWT"},
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode()
+    )
+    _jwt_hmac = hmac.new(
+        settings.JWT_SECRET.encode(), digestmod=HMAC_DIGESTS[settings.JWT_ALGORITHM]
+    )
+
 
 def create_access_token(
     subject: str | Any, expires_delta: timedelta | None = None
@@ -31,14 +73,99 @@ def create_access_token(
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_EXPIRATION)
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
-    return encoded_jwt
+    to_encode = {"exp": int(expire.timestamp()), "sub": str(subject)}
+
+    if _jwt_hmac is None:
+        return jwt.encode(
+            to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+        )
+
+    payload = _b64url(json.dumps(to_encode, separators=(",", ":")).encode())
+    signing_input = _jwt_header + b"." + payload
+    mac = _jwt_hmac.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+
+def _decode_hmac_token(token: str) -> dict[str, Any] | None:
+    """
+    Verify one of our own HS* tokens with the prebuilt HMAC (the mirror of
+    create_access_token). Returns None for anything else (other headers or
+    claims) so jose can do the full validation.
+
+    Raises:
+        JWTError: If the signature doesn't match
+    """
+    try:
+        header, payload, signature = token.encode("ascii").split(b".")
+    except (UnicodeEncodeError, ValueError):
+        return None
+    if header != _jwt_header:
+        return None
+
+    mac = _jwt_hmac.copy()
+    mac.update(header + b"." + payload)
+    if not hmac.compare_digest(_b64url(mac.digest()), signature):
+        raise JWTError("Signature verification failed.")
+
+    try:
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + b"=" * (-len(payload) % 4))
+        )
+    except ValueError:
+        return None
+    # Only the claims we issue; jose validates anything else (aud, nbf, iat, ...)
+    if (
+        not isinstance(claims, dict)
+        or claims.keys() - {"exp", "sub"}
+        or type(claims.get("exp", 0)) is not int
+        or not isinstance(claims.get("sub", ""), str)
+    ):
+        return None
+    return claims
 
 
-def _prepare_password_for_bcrypt(password: str) -> str:
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _decode_token(token: str) -> dict[str, Any]:
+    """
+    Verify and decode a JWT. Only successful decodes are cached (jose raises
+    otherwise), so callers must still check "exp" against the current time.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        The verified payload (shared between calls; don't mutate it)
+    """
+    if _jwt_hmac is not None:
+        claims = _decode_hmac_token(token)
+        if claims is not None:
+            return claims
+    return jwt.decode(token, _jwt_key, algorithms=[settings.JWT_ALGORITHM])
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """
+    Verify an access token and check that it hasn't expired.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        The verified payload (shared between calls; don't mutate it)
+
+    Raises:
+        JWTError: If the token is invalid or expired
+    """
+    payload = _decode_token(token)
+    # The cached payload was verified when first seen; expiry is time-based
+    exp = payload.get("exp")
+    if exp is not None and time.time() > exp:
+        raise JWTError("Signature has expired.")
+    return payload
+
+
+def _prepare_password_for_bcrypt(password: str) -> bytes:
     """
     Prepare password for bcrypt hashing.
     Bcrypt has a 72-byte limit, so for longer passwords we pre-hash with SHA-256.
@@ -48,20 +175,20 @@ def _prepare_password_for_bcrypt(password: str) -> str:
         password: Plain text password
 
     Returns:
-        Password ready for bcrypt (either original or base64-encoded SHA-256 hash)
+        UTF-8 password bytes ready for bcrypt (either the original password or
+        the base64-encoded SHA-256 hash)
     """
     password_bytes = password.encode("utf-8")
 
     # If password is 72 bytes or less, use it directly
     if len(password_bytes) <= BCRYPT_MAX_LENGTH:
-        return password
+        return password_bytes
 
     # For longer passwords, pre-hash with SHA-256 and encode as base64
     # SHA-256 produces 32 bytes, base64 encoding produces 44 characters (~44 bytes)
-    # This is well under the 72-byte limit
-    sha256_hash = hashlib.sha256(password_bytes).digest()
-    base64_hash = base64.b64encode(sha256_hash).decode("utf-8")
-    return base64_hash
+    # This is well under the 72-byte limit. The base64 form is kept (rather than
+    # the raw digest) so hashes stored by earlier versions still verify.
+    return base64.b64encode(hashlib.sha256(password_bytes).digest())
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -76,13 +203,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    # A truncated or foreign hash can't match. Rejecting it by its fixed format
+    # first keeps short values away from bcrypt, which panics on them; the
+    # check leaks nothing about valid hashes.
+    if len(hashed_password) != BCRYPT_HASH_LENGTH or not hashed_password.startswith(
+        BCRYPT_PREFIXES
+    ):
+        return False
     prepared_password = _prepare_password_for_bcrypt(plain_password)
-    return pwd_context.verify(prepared_password, hashed_password)
+    try:
+        return bcrypt.checkpw(prepared_password, hashed_password.encode("ascii"))
+    except ValueError:
+        # Right shape but a bad cost or salt (also covers non-ASCII values)
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using bcrypt (cost factor from BCRYPT_ROUNDS).
     Handles passwords longer than 72 bytes by pre-hashing with SHA-256.
 
     Args:
@@ -92,7 +230,9 @@ def get_password_hash(password: str) -> str:
         Bcrypt hash of the password
     """
     prepared_password = _prepare_password_for_bcrypt(password)
-    return pwd_context.hash(prepared_password)
+    return bcrypt.hashpw(
+        prepared_password, bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode("ascii")
 
 
 def get_current_user(
@@ -101,9 +241,7 @@ def get_current_user(
     from app.models.user import User
 
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_access_token(token)
         user_id_str = payload.get("sub")
         if user_id_str is None:
             raise HTTPException(
@@ -118,18 +256,15 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
+    # One primary-key lookup. The session is new for this request, so the row
+    # is read fresh from the database and permission changes made after the
+    # token was issued are seen without a second refresh() round trip.
     user = User.get(db, id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    # Refresh the user object to ensure we have the latest data from the database
-    # This is important if user permissions were changed after the token was issued
-    try:
-        db.refresh(user)
-        logger.debug(f"Loaded user {user.id} (email: {user.email}, is_superuser: {user.is_superuser})")
-    except Exception as e:
-        logger.warning(f"Could not refresh user object: {e}")
-        # If refresh fails, expire the object to force reload on next access
-        db.expire(user)
-    
+    logger.debug(
+        f"Loaded user {user.id} "
+        f"(email: {user.email}, is_superuser: {user.is_superuser})"
+    )
+
     return user
@@ -0,0 +1,168 @@
+"""
+Static Files
+StaticFiles with cache headers tuned for the public and storage mounts.
+"""
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Bundler-hashed asset names, e.g. app.3f9a2c1b.js or main-5d41402abc4b.css
+HASHED_RE = re.compile(r"[.-][0-9a-fA-F]{8,}\.[A-Za-z0-9]+$")
+
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_CONTROL_DEFAULT = "public, max-age=3600"
+
+# Small files are kept in memory and re-stat'ed at most every few seconds
+MEMORY_MAX_FILE_SIZE = 1024 * 1024
+MEMORY_MAX_TOTAL_SIZE = 64 * 1024 * 1024
+MEMORY_REVALIDATE_SECONDS = 5.0
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag (RFC 9110).
+
+    Args:
+        if_none_match: Value of the If-None-Match request header
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+class CachingStaticFiles(StaticFiles):
+    """
+    StaticFiles that sends a weak mtime/size ETag and a Cache-Control header.
+    Hashed asset names are cached for a year as immutable, everything else
+    for an hour. Matching conditional requests get a body-less 304.
+
+    GETs of files up to MEMORY_MAX_FILE_SIZE are served from memory; the
+    file is only stat'ed again once MEMORY_REVALIDATE_SECONDS have passed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # path -> (checked_at, mtime_ns, size, headers, body)
+        self._memory: dict[str, tuple[float, int, int, dict[str, str], bytes]] = {}
+        self._memory_size = 0
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] != "GET":
+            return await super().get_response(path, scope)
+
+        entry = self._memory.get(path)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < MEMORY_REVALIDATE_SECONDS:
+            return self._memory_response(entry, scope)
+
+        try:
+            response = await super().get_response(path, scope)
+        except HTTPException:
+            self._forget(path)
+            raise
+        if response.status_code == 304 and entry is not None:
+            # Conditional request after the window: a matching ETag means the
+            # file is unchanged, so the cached copy stays valid
+            if response.headers.get("etag") == entry[3].get("etag"):
+                self._memory[path] = (now, *entry[1:])
+            else:
+                self._forget(path)
+            return response
+        if not isinstance(response, FileResponse) or response.status_code != 200:
+            self._forget(path)
+            return response
+
+        stat_result = response.stat_result
+        size = stat_result.st_size
+        if entry is not None:
+            if (entry[1], entry[2]) == (stat_result.st_mtime_ns, size):
+                entry = (now, *entry[1:])
+                self._memory[path] = entry
+                return self._memory_response(entry, scope)
+            self._forget(path)
+
+        if (
+            size > MEMORY_MAX_FILE_SIZE
+            or self._memory_size + size > MEMORY_MAX_TOTAL_SIZE
+        ):
+            return response
+
+        body = await anyio.to_thread.run_sync(Path(response.path).read_bytes)
+        if len(body) != size:
+            # Changed between stat and read; serve it from disk this time
+            return response
+
+        # Concurrent misses may have cached this path during the read; replace
+        # their entry so its size isn't counted twice
+        self._forget(path)
+        if self._memory_size + size > MEMORY_MAX_TOTAL_SIZE:
+            return response
+
+        entry = (now, stat_result.st_mtime_ns, size, dict(response.headers), body)
+        self._memory[path] = entry
+        self._memory_size += size
+        return self._memory_response(entry, scope)
+
+    def _forget(self, path: str) -> None:
+        entry = self._memory.pop(path, None)
+        if entry is not None:
+            self._memory_size -= entry[2]
+
+    def _memory_response(
+        self, entry: tuple[float, int, int, dict[str, str], bytes], scope: Scope
+    ) -> Response:
+        headers = entry[3]
+        if self.is_not_modified(Headers(headers), Headers(scope=scope)):
+            return NotModifiedResponse(Headers(headers))
+        return Response(entry[4], headers=headers)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = FileResponse(
+            full_path, status_code=status_code, stat_result=stat_result
+        )
+        response.headers["ETag"] = (
+            f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        )
+        response.headers["Cache-Control"] = (
+            CACHE_CONTROL_IMMUTABLE
+            if HASHED_RE.search(os.fspath(full_path))
+            else CACHE_CONTROL_DEFAULT
+        )
+
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def is_not_modified(
+        self, response_headers: Headers, request_headers: Headers
+    ) -> bool:
+        # Starlette only strips "W/" from the request side, so a weak ETag in
+        # the response would never match. If-None-Match takes precedence over
+        # If-Modified-Since when present.
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, response_headers["etag"])
+        return super().is_not_modified(response_headers, request_headers)
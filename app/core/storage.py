@@ -5,13 +5,18 @@ Supports local filesystem, S3, FTP, SFTP, and more.
 """
 
 import logging
+import mimetypes
 import os
-from typing import BinaryIO
+from collections.abc import Iterator
+from typing import Any, BinaryIO
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming files in and out of storage
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 # Lazy import helper - avoids import errors during migrations
 def _ensure_fs_imported():
@@ -256,6 +261,59 @@ class Storage:
             logger.error(f"Storage get error for {path}: {e}")
             return None
 
+    def put_stream(
+        self,
+        path: str,
+        stream: BinaryIO,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        overwrite: bool = True,
+    ) -> bool:
+        """
+        Store a file-like object at given path, copying it chunk by chunk.
+        Similar to Laravel's Storage::writeStream().
+
+        Args:
+            path: File path
+            stream: Binary file-like object to read from
+            chunk_size: Number of bytes copied per read
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            True if successful
+        """
+        try:
+            if not overwrite and self.exists(path):
+                return False
+
+            # Ensure directory exists
+            dir_path = os.path.dirname(path)
+            if dir_path:
+                self.filesystem.makedirs(dir_path, recreate=True)
+
+            self.filesystem.upload(path, stream, chunk_size=chunk_size)
+            return True
+        except Exception as e:
+            logger.error(f"Storage put_stream error for {path}: {e}")
+            return False
+
+    def read_stream(
+        self, path: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Iterate over file content in chunks without loading the whole file.
+        Similar to Laravel's Storage::readStream().
+
+        Args:
+            path: File path
+            chunk_size: Number of bytes yielded per chunk
+
+        Yields:
+            File content chunks
+        """
+        with self.filesystem.openbin(path, "r") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
     def exists(self, path: str) -> bool:
         """
         Check if file exists.
@@ -268,7 +326,8 @@ class Storage:
             True if file exists
         """
         try:
-            return self.filesystem.exists(path) and self.filesystem.isfile(path)
+            # isfile() is False for missing paths, so one lookup is enough
+            return self.filesystem.isfile(path)
         except Exception:
             return False
 
@@ -402,6 +461,33 @@ class Storage:
         except Exception:
             return None
 
+    def stat(self, path: str) -> dict[str, Any] | None:
+        """
+        Get all file metadata from a single filesystem lookup.
+        Replaces separate exists/size/mime_type/last_modified calls, which
+        each cost a stat (or an S3 HEAD request) of their own.
+
+        Args:
+            path: File path
+
+        Returns:
+            Dict with size, mime_type, last_modified and url,
+            or None if the file doesn't exist
+        """
+        try:
+            info = self.filesystem.getinfo(path, namespaces=["details"])
+        except Exception:
+            return None
+        if not info.is_file:
+            return None
+
+        return {
+            "size": info.size,
+            "mime_type": mimetypes.guess_type(path)[0],
+            "last_modified": info.modified.timestamp() if info.modified else None,
+            "url": self.url(path),
+        }
+
     def files(self, directory: str = "") -> list[str]:
         """
         Get list of files in directory.
@@ -3,7 +3,15 @@ HTTP Middleware
 Laravel-like middleware structure for FastAPI Boilerplate
 """
 
+from app.http.middleware.fast_path import FastPathMiddleware
 from app.http.middleware.logging import LoggingMiddleware
 from app.http.middleware.rate_limit import RateLimitMiddleware
+from app.http.middleware.security import SecurityMiddleware, request_id_var
 
-__all__ = ["LoggingMiddleware", "RateLimitMiddleware"]
+__all__ = [
+    "FastPathMiddleware",
+    "LoggingMiddleware",
+    "RateLimitMiddleware",
+    "SecurityMiddleware",
+    "request_id_var",
+]
@@ -0,0 +1,26 @@
+"""Fast Path Middleware"""
+
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class FastPathMiddleware:
+    """
+    Hands selected (method, path) pairs to a separate, lighter ASGI app.
+    Registered outermost, so matching requests skip the rest of the main
+    app's middleware stack (logging, rate limiting) entirely.
+    """
+
+    def __init__(
+        self, app: ASGIApp, fast_app: ASGIApp, routes: Iterable[tuple[str, str]]
+    ):
+        self.app = app
+        self.fast_app = fast_app
+        self.routes = frozenset(routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and (scope["method"], scope["path"]) in self.routes:
+            await self.fast_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
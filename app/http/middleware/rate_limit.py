@@ -50,6 +50,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 )
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # CORS preflights don't count towards the limit
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
         client_ip = request.client.host if request.client else "unknown"
         current_time = time.time()
 
@@ -0,0 +1,129 @@
+import os
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from app.api.v1.controllers.users import read_user_me
+from app.core.error_handler import global_exception_handler
+from app.core.routing import StaticRouteIndex
+from app.core.static_files import CachingStaticFiles
+from app.http.middleware import (
+    FastPathMiddleware,
+    LoggingMiddleware,
+    RateLimitMiddleware,
+    SecurityMiddleware,
+)
+from app.schemas.user import UserResponse
+from config import settings
+from routes.api import register_api_routes
+
+app = FastAPI(
+    title=settings.APP_NAME,
+    openapi_url="/openapi.json",
+    debug=settings.APP_DEBUG,
+    default_response_class=ORJSONResponse,
+)
+
+
+# Add global exception handler
+@app.exception_handler(Exception)
+async def exception_handler(request: Request, exc: Exception):
+    """Handle all unhandled exceptions."""
+    return await global_exception_handler(request, exc)
+
+
+# Set up CORS - never allow all origins in production. Starlette checks an
+# origin with `origin in allow_origins`, so a frozenset makes that a hash lookup.
+cors_origins = settings.cors_origins_set
+if settings.APP_ENV == "production" and "*" in cors_origins:
+    # In production, don't allow wildcard
+    cors_origins = cors_origins - {"*"}
+    if not cors_origins:
+        raise ValueError(
+            "CORS origins must be specified in production. Cannot use '*' wildcard."
+        )
+
+cors_options = {
+    "allow_origins": cors_origins,
+    "allow_credentials": True,
+    "allow_methods": ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    "allow_headers": ["Content-Type", "Authorization", "X-Request-ID"],
+}
+
+# Add security headers and request ID middleware
+app.add_middleware(SecurityMiddleware)
+
+# Add custom middlewares
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(RateLimitMiddleware)
+
+# CORS is added last so it is outermost: preflights are answered before any
+# other middleware runs, and 429s from the rate limiter carry CORS headers
+app.add_middleware(CORSMiddleware, **cors_options)
+
+# Fast path: hot, cheap endpoints are served by a minimal app that only has
+# CORS, security headers/request ID and the exception handler. Login and other
+# endpoints that need rate limiting must not be listed here.
+FAST_PATHS = {("GET", "/api/v1/users/me")}
+
+# Mirrors the main app's options (except the OpenAPI schema), so responses and
+# error pages are the same apart from the skipped middleware
+fast_app = FastAPI(
+    openapi_url=None,
+    debug=settings.APP_DEBUG,
+    default_response_class=ORJSONResponse,
+)
+fast_app.dependency_overrides = app.dependency_overrides
+fast_app.add_exception_handler(Exception, exception_handler)
+fast_app.add_api_route(
+    "/api/v1/users/me", read_user_me, methods=["GET"], response_model=UserResponse
+)
+fast_app.add_middleware(SecurityMiddleware)
+fast_app.add_middleware(CORSMiddleware, **cors_options)
+
+app.add_middleware(FastPathMiddleware, fast_app=fast_app, routes=FAST_PATHS)
+
+
+@app.get("/")
+async def root():
+    return {
+        "message": "Welcome to the FastAPI Boilerplate API",
+        "version": "1.0.0",
+        "docs": "/docs",
+        "api_docs": "/redoc",
+    }
+
+
+# Mount static files (public directory)
+# Similar to Laravel's public directory
+public_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "public")
+if os.path.exists(public_dir):
+    app.mount("/public", CachingStaticFiles(directory=public_dir), name="public")
+
+# Mount storage files for public access
+# Files in public/storage will be accessible via /storage/ URL
+storage_public_dir = os.path.join(public_dir, "storage")
+if os.path.exists(storage_public_dir):
+    app.mount(
+        "/storage", CachingStaticFiles(directory=storage_public_dir), name="storage"
+    )
+
+# Include API routes (Laravel-like routes/api.php)
+api_router = register_api_routes()
+app.include_router(api_router, prefix="/api/v1")
+
+# Look up fixed-path routes by dict instead of trying every route in turn
+app.router.middleware_stack = StaticRouteIndex(app.router)
+
+
+# Initialize Prometheus instrumentation if enabled
+if settings.ENABLE_METRICS:
+    try:
+        from prometheus_fastapi_instrumentator import Instrumentator
+        Instrumentator().instrument(app).expose(app)
+    except ImportError:
+        import logging
+        logging.getLogger(__name__).warning(
+            "prometheus-fastapi-instrumentator not installed, metrics disabled."
+        )
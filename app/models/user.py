@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
-from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Integer, Row, String, delete, select
 from sqlalchemy.orm import Session
 
 from app.core.database import Base
@@ -26,15 +25,16 @@ class User(Base):
     )
 
     @classmethod
-    def get(cls, db: Session, id: int) -> Optional["User"]:
-        return db.query(cls).filter(cls.id == id).first()
+    def get(cls, db: Session, id: int) -> "User | None":
+        # Primary-key lookup: served from the identity map when already loaded
+        return db.get(cls, id)
 
     @classmethod
-    def get_by_email(cls, db: Session, email: str) -> Optional["User"]:
+    def get_by_email(cls, db: Session, email: str) -> "User | None":
         return db.query(cls).filter(cls.email == email).first()
 
     @classmethod
-    def authenticate(cls, db: Session, email: str, password: str) -> Optional["User"]:
+    def authenticate(cls, db: Session, email: str, password: str) -> "User | None":
         user = cls.get_by_email(db, email=email)
         if not user:
             return None
@@ -70,5 +70,59 @@ class User(Base):
         return db_obj
 
     @classmethod
-    def get_multi(cls, db: Session, skip: int = 0, limit: int = 100) -> list["User"]:
-        return db.query(cls).offset(skip).limit(limit).all()
+    def destroy(cls, db: Session, id: int) -> "User | None":
+        """
+        Delete a user by primary key, like Laravel's Model::destroy().
+        Uses a single DELETE ... RETURNING where the dialect supports it.
+
+        Returns:
+            The deleted user (detached, fully loaded) or None if not found
+        """
+        if not db.get_bind().dialect.delete_returning:
+            user = cls.get(db, id=id)
+            if user:
+                db.delete(user)
+                db.commit()
+            return user
+
+        user = db.execute(
+            delete(cls).where(cls.id == id).returning(cls)
+        ).scalar_one_or_none()
+        if user:
+            # Detach so the commit doesn't expire a row that no longer exists
+            db.expunge(user)
+        db.commit()
+        return user
+
+    @classmethod
+    def get_multi(
+        cls, db: Session, after_id: int | None = None, limit: int = 100
+    ) -> list["User"]:
+        # Keyset pagination: seek past the last seen id instead of OFFSET, so
+        # deep pages cost the same as the first one
+        query = db.query(cls)
+        if after_id is not None:
+            query = query.filter(cls.id > after_id)
+        return query.order_by(cls.id).limit(limit).all()
+
+    @classmethod
+    def get_multi_rows(
+        cls, db: Session, after_id: int | None = None, limit: int = 100
+    ) -> list[Row]:
+        """
+        Like get_multi, but selects only the columns the API exposes and
+        returns plain rows: no ORM objects, identity-map entries or password
+        hashes are loaded for list pages.
+        """
+        query = select(
+            cls.id,
+            cls.email,
+            cls.full_name,
+            cls.is_active,
+            cls.is_superuser,
+            cls.created_at,
+            cls.updated_at,
+        )
+        if after_id is not None:
+            query = query.where(cls.id > after_id)
+        return db.execute(query.order_by(cls.id).limit(limit)).all()
@@ -17,4 +17,4 @@ class TokenWithUser(BaseModel):
 
 
 class TokenPayload(BaseModel):
-    sub: int = None
+    sub: int | None = None
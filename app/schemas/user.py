@@ -69,3 +69,9 @@ class UserResponse(UserBase):
     class Config:
         from_attributes = True
         json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+
+
+class UserPage(BaseModel):
+    items: list[UserResponse]
+    # Pass as after_id to fetch the next page; None on the last page
+    next_after: int | None = None
@@ -5,11 +5,14 @@ Laravel-like configuration structure for FastAPI Boilerplate
 
 import json
 import os
-from functools import lru_cache
-from typing import List, Optional
+from functools import cache, cached_property
+from typing import TYPE_CHECKING
 
-from pydantic import root_validator
-from pydantic_settings import BaseSettings
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import URL
 
 
 class Settings(BaseSettings):
@@ -41,6 +44,9 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_EXPIRATION: int = int(os.getenv("JWT_EXPIRATION", "3600"))
 
+    # Password Hashing - bcrypt cost factor; each +1 doubles the CPU per hash
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
     # Redis Configuration
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
@@ -57,9 +63,13 @@ class Settings(BaseSettings):
     RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
 
     # CORS Configuration
-    BACKEND_CORS_ORIGINS: list[str] = json.loads(
-        os.getenv(
-            "BACKEND_CORS_ORIGINS", '["http://localhost:3000","http://localhost:8000"]'
+    # A tuple, so the frozen settings model stays hashable
+    BACKEND_CORS_ORIGINS: tuple[str, ...] = tuple(
+        json.loads(
+            os.getenv(
+                "BACKEND_CORS_ORIGINS",
+                '["http://localhost:3000","http://localhost:8000"]',
+            )
         )
     )
 
@@ -120,8 +130,45 @@ class Settings(BaseSettings):
     SFTP_PASSWORD: str | None = os.getenv("SFTP_PASSWORD")
     SFTP_KEY: str | None = os.getenv("SFTP_KEY")
 
-    @root_validator(skip_on_failure=True)
-    def validate_secrets(cls, values):
+    @cached_property
+    def cors_origins_set(self) -> frozenset[str]:
+        """BACKEND_CORS_ORIGINS as a set, for O(1) origin checks per request."""
+        return frozenset(self.BACKEND_CORS_ORIGINS)
+
+    @cached_property
+    def database_url(self) -> "URL":
+        """
+        Database URL for SQLAlchemy, built once from the DB_* settings.
+        Supports PostgreSQL and MySQL similar to Laravel's database configuration.
+        URL.create escapes the credentials, so no manual quoting is needed.
+        """
+        from sqlalchemy.engine import URL
+
+        connection = self.DB_CONNECTION.lower()
+
+        # SQLite (if needed in future)
+        if connection == "sqlite":
+            return URL.create("sqlite", database=self.DB_DATABASE)
+
+        if connection in ["postgresql", "postgres"]:
+            drivername = "postgresql"
+        elif connection in ["mysql", "mysql+pymysql"]:
+            drivername = "mysql+pymysql"
+        else:
+            # Default: use the connection name as-is
+            drivername = self.DB_CONNECTION
+
+        return URL.create(
+            drivername,
+            username=self.DB_USERNAME,
+            password=self.DB_PASSWORD,
+            host=self.DB_HOST,
+            port=self.DB_PORT,
+            database=self.DB_DATABASE,
+        )
+
+    @model_validator(mode="after")
+    def validate_secrets(self) -> "Settings":
         """Validate that secrets are set and not using defaults in production."""
         insecure_defaults = [
             "your-secret-key-here",
@@ -131,9 +178,9 @@ class Settings(BaseSettings):
         ]
 
         # Only validate in production
-        if values.get("APP_ENV") == "production":
-            app_key = values.get("APP_KEY", "")
-            jwt_secret = values.get("JWT_SECRET", "")
+        if self.APP_ENV == "production":
+            app_key = self.APP_KEY
+            jwt_secret = self.JWT_SECRET
 
             if app_key in insecure_defaults:
                 raise ValueError(
@@ -155,14 +202,13 @@ class Settings(BaseSettings):
                     "JWT_SECRET must be at least 32 characters long for security"
                 )
 
-        return values
+        return self
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Frozen: settings are read-only once loaded (and hashable)
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     return Settings()
 